@@ -1,20 +1,207 @@
+import argparse
+import asyncio
+import aiohttp
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import io
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import orjson
+import random
+import re
 import time
-import pandas as pd
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from decimal import Decimal
+from tqdm.auto import tqdm
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Optional, Union
+from urllib.parse import urlsplit
 import os
+import sys
+import tempfile
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Statuses worth retrying, and the exponential backoff schedule used for them
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 8
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+# Quota headers sent by the API; once the remaining quota drops to
+# RATE_LIMIT_THRESHOLD, all requests wait for the window to reset
+RATE_LIMIT_REMAINING_HEADERS = ('X-RateLimit-Remaining', 'RateLimit-Remaining')
+RATE_LIMIT_RESET_HEADERS = ('X-RateLimit-Reset', 'RateLimit-Reset')
+RATE_LIMIT_THRESHOLD = 1
+
+# One µSTX in STX; amounts are kept as Decimal so sums over many wallets stay exact
+_MICRO = Decimal('0.000001')
+
+# Shape of a Stacks principal: 'S', a network/version char, then c32 digits (the
+# c32 alphabet has no I, L, O or U; leading zero bytes make some addresses much
+# shorter, e.g. the boot address), optionally followed by '.contract-name'
+STX_ADDRESS_PATTERN = r'^S[PMNT][0-9A-HJKMNP-TV-Z]{9,41}(?:\.[A-Za-z][A-Za-z0-9_-]{0,39})?$'
+
+# Google Sheets link: captures the spreadsheet id, whether it is already an
+# export link, and the tab's gid when the link points at a specific sheet
+_GS_RE = re.compile(r'docs\.google\.com/spreadsheets/d/(?P<id>[^/?#]+)(?P<export>/export)?'
+                    r'(?:.*?[?#&]gid=(?P<gid>\d+))?')
+
+# Maximum number of addresses sent in a single batch balances request
+BATCH_SIZE = 50
+
+# Seconds to skip the batch endpoint after the API reports it doesn't exist
+BATCH_UNAVAILABLE_TTL = 24 * 3600
+
+# The Rust-based calamine reader is much faster than openpyxl; when it isn't
+# installed let pandas pick its default engine for the file type
+EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else None
+
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# pyarrow's multithreaded CSV parser beats the default C engine on large files
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else None
+
+# Arrow-backed string columns speed up the vectorized wallet validation
+# (requires pandas 2+ with pyarrow installed)
+READ_KWARGS = ({'dtype_backend': 'pyarrow'} if HAS_PYARROW and importlib.util.find_spec('pandas')
+               and int(importlib.metadata.version('pandas').split('.')[0]) >= 2 else {})
+
+# xlsxwriter writes .xlsx files faster than openpyxl; fall back to the pandas default
+EXCEL_WRITER_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else None
+
+# Balance fields exported to Excel and their column headers (plus a final Status column)
+EXPORT_COLUMNS = {
+    'name': 'Name',
+    'address': 'Address',
+    'balance_stx': 'Available_STX',
+    'locked_stx': 'Locked_STX',
+    'total_stx': 'Total_STX',
+    'nonce': 'Nonce',
+}
+
+@functools.lru_cache(maxsize=None)
+def _pd():
+    """
+    Import pandas on first use
+    
+    pandas is only needed to load spreadsheets and export reports, so the
+    hardcoded-wallet flow starts without paying for its import.
+    
+    Raises:
+        ImportError: If pandas is not installed
+    """
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError("pandas is required for Excel/CSV/Google Sheets support and report export. "
+                          "Install it with: pip install pandas openpyxl") from e
+    return pd
+
+def _json_default(obj):
+    """Serialize Decimal STX amounts as JSON numbers for orjson"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+@dataclass(slots=True)
+class Balance:
+    """
+    Balance check result for a single wallet
+    
+    Amounts are stored as integer µSTX; the STX amounts are derived on access.
+    Failed checks have success=False, an error message and zero amounts.
+    """
+    name: str
+    address: str
+    balance_ustx: int = 0
+    locked_ustx: int = 0
+    nonce: int = 0
+    success: bool = True
+    error: Optional[str] = None
+    # Failing HTTP response details, only kept for debug output
+    debug_status: Optional[int] = field(default=None, repr=False)
+    debug_body: str = field(default='', repr=False)
+    
+    @property
+    def balance_stx(self) -> Decimal:
+        return self.balance_ustx * _MICRO
+    
+    @property
+    def locked_stx(self) -> Decimal:
+        return self.locked_ustx * _MICRO
+    
+    @property
+    def total_stx(self) -> Decimal:
+        return (self.balance_ustx + self.locked_ustx) * _MICRO
+    
+    def to_dict(self) -> Dict:
+        """Result as a dictionary, in the JSON export format"""
+        if not self.success:
+            return {'name': self.name, 'address': self.address, 'error': self.error, 'success': False}
+        return {
+            'name': self.name,
+            'address': self.address,
+            'balance_stx': self.balance_stx,
+            'locked_stx': self.locked_stx,
+            'total_stx': self.total_stx,
+            'balance_ustx': self.balance_ustx,
+            'locked_ustx': self.locked_ustx,
+            'nonce': self.nonce,
+            'success': True
+        }
 
 class STXBalanceChecker:
-    def __init__(self, base_url: str = "https://api.hiro.so/v2/accounts/"):
+    # Accepted header variations for the wallet name and address columns, in
+    # order of preference when a sheet has more than one of them
+    NAME_COLUMNS_PRIORITY = ('Name', 'Wallet_Name', 'wallet_name', 'name', 'Label', 'label')
+    ADDRESS_COLUMNS_PRIORITY = ('Address', 'Wallet_Address', 'wallet_address', 'address', 'STX_Address', 'stx_address')
+    NAME_COLUMNS = frozenset(NAME_COLUMNS_PRIORITY)
+    ADDRESS_COLUMNS = frozenset(ADDRESS_COLUMNS_PRIORITY)
+    
+    def __init__(self, base_url: str = "https://api.hiro.so/v2/accounts/", use_cache: bool = True,
+                 cache_ttl: float = 300):
         self.base_url = base_url
+        # Monotonic time before which no request should be sent (rate limit window)
+        self._rate_limited_until = 0.0
+        # Raw API responses are cached per address along with the chain tip they
+        # were fetched at, so reruns at the same block height don't hit the
+        # network again; when the chain tip is unknown, entries expire after cache_ttl seconds
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self.cache_dir = Path.home() / '.cache' / 'stx_checker'
+        # Root of the Hiro API (scheme + host), used for the extended endpoints
+        parts = urlsplit(base_url)
+        self.api_root = f"{parts.scheme}://{parts.netloc}"
+        # Marker left when the batch endpoint 404s, so later runs go
+        # straight to per-address lookups
+        self._batch_marker = self.cache_dir / f"batch-unavailable-{parts.netloc.replace(':', '_')}"
+        self._batch_unavailable = False
         self.session = requests.Session()
+        # Size the connection pool for parallel callers and let urllib3 retry
+        # dropped connections only; 429/5xx responses (even with Retry-After)
+        # are passed through so get_balance's backoff and the shared rate limit
+        # pause are the only status retries
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(total=5, status=0, backoff_factor=0.5, allowed_methods=frozenset({'GET'}),
+                              respect_retry_after_header=False)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         # Add a user agent to be a good API citizen
         self.session.headers.update({
             'User-Agent': 'STX-Balance-Checker/1.0'
         })
     
-    def load_wallets_from_excel(self, file_path: str, sheet_name: str = None) -> List[Dict[str, str]]:
+    def load_wallets_from_excel(self, file_path: str, sheet_name: Union[str, List[str], None] = None) -> List[Dict[str, str]]:
         """
         Load wallet addresses and names from Excel file
         
@@ -22,45 +209,21 @@ class STXBalanceChecker:
         
         Args:
             file_path: Path to Excel file (.xlsx or .xls)
-            sheet_name: Specific sheet name (if None, uses first sheet)
+            sheet_name: Sheet name, or list of sheet names to combine (if None, uses first sheet)
             
         Returns:
             List of dictionaries with 'name' and 'address' keys
         """
         try:
-            # Read Excel file
-            if sheet_name:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            else:
-                df = pd.read_excel(file_path)
-            
-            # Try different column name variations
-            name_columns = ['Name', 'Wallet_Name', 'wallet_name', 'name', 'Label', 'label']
-            address_columns = ['Address', 'Wallet_Address', 'wallet_address', 'address', 'STX_Address', 'stx_address']
-            
-            name_col = None
-            address_col = None
-            
-            # Find the correct column names
-            for col in df.columns:
-                if col in name_columns:
-                    name_col = col
-                if col in address_columns:
-                    address_col = col
-            
-            if not address_col:
-                raise ValueError("No address column found. Expected columns: 'Address', 'Wallet_Address', 'address', etc.")
+            # Only materialize the name/address columns
+            usecols = lambda col: col in self.NAME_COLUMNS or col in self.ADDRESS_COLUMNS
+            sheet_names = [sheet_name] if isinstance(sheet_name, str) else sheet_name
             
+            # Open the workbook once and reuse it for every requested sheet
             wallets = []
-            for _, row in df.iterrows():
-                address = str(row[address_col]).strip()
-                name = str(row[name_col]).strip() if name_col and pd.notna(row[name_col]) else f"Wallet_{len(wallets) + 1}"
-                
-                if address and address.lower() != 'nan' and len(address) > 10:  # Basic validation
-                    wallets.append({
-                        'name': name,
-                        'address': address
-                    })
+            with _pd().ExcelFile(file_path, engine=EXCEL_ENGINE) as xls:
+                for sheet in sheet_names or xls.sheet_names[:1]:
+                    wallets.extend(self._df_to_wallets(xls.parse(sheet, usecols=usecols, **READ_KWARGS)))
             
             print(f"✅ Loaded {len(wallets)} wallet addresses from Excel file")
             return wallets
@@ -82,49 +245,26 @@ class STXBalanceChecker:
         """
         try:
             # Convert Google Sheets URL to CSV export format if needed
-            if 'docs.google.com/spreadsheets' in sheet_url and 'export' not in sheet_url:
-                # Extract the sheet ID from the URL
-                sheet_id = sheet_url.split('/d/')[1].split('/')[0]
+            match = _GS_RE.search(sheet_url)
+            if match and not match['export']:
+                csv_url = f"https://docs.google.com/spreadsheets/d/{match['id']}/export?format=csv"
                 
-                if sheet_name:
+                if match['gid']:
+                    # Export the tab the link points at
+                    csv_url += f"&gid={match['gid']}"
+                elif sheet_name:
                     # For specific sheet, we need to use the gid parameter
-                    csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid=0"
-                    print("⚠️  Note: For specific sheet names, you may need to manually get the gid parameter from Google Sheets")
-                else:
-                    csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
+                    print("⚠️  Note: For specific sheet names, use a link to that sheet (it includes its gid parameter)")
             else:
                 csv_url = sheet_url
             
-            # Read the CSV data
-            df = pd.read_csv(csv_url)
-            
-            # Try different column name variations
-            name_columns = ['Name', 'Wallet_Name', 'wallet_name', 'name', 'Label', 'label']
-            address_columns = ['Address', 'Wallet_Address', 'wallet_address', 'address', 'STX_Address', 'stx_address']
-            
-            name_col = None
-            address_col = None
-            
-            # Find the correct column names
-            for col in df.columns:
-                if col in name_columns:
-                    name_col = col
-                if col in address_columns:
-                    address_col = col
-            
-            if not address_col:
-                raise ValueError("No address column found. Expected columns: 'Address', 'Wallet_Address', 'address', etc.")
+            # Download through the shared session (connection pooling, retries),
+            # then parse the CSV data from memory
+            response = self.session.get(csv_url, timeout=30)
+            response.raise_for_status()
+            df = self._read_wallet_csv(io.BytesIO(response.content))
             
-            wallets = []
-            for _, row in df.iterrows():
-                address = str(row[address_col]).strip()
-                name = str(row[name_col]).strip() if name_col and pd.notna(row[name_col]) else f"Wallet_{len(wallets) + 1}"
-                
-                if address and address.lower() != 'nan' and len(address) > 10:  # Basic validation
-                    wallets.append({
-                        'name': name,
-                        'address': address
-                    })
+            wallets = self._df_to_wallets(df)
             
             print(f"✅ Loaded {len(wallets)} wallet addresses from Google Sheets")
             return wallets
@@ -145,35 +285,9 @@ class STXBalanceChecker:
             List of dictionaries with 'name' and 'address' keys
         """
         try:
-            df = pd.read_csv(file_path)
+            df = self._read_wallet_csv(file_path)
             
-            # Try different column name variations
-            name_columns = ['Name', 'Wallet_Name', 'wallet_name', 'name', 'Label', 'label']
-            address_columns = ['Address', 'Wallet_Address', 'wallet_address', 'address', 'STX_Address', 'stx_address']
-            
-            name_col = None
-            address_col = None
-            
-            # Find the correct column names
-            for col in df.columns:
-                if col in name_columns:
-                    name_col = col
-                if col in address_columns:
-                    address_col = col
-            
-            if not address_col:
-                raise ValueError("No address column found. Expected columns: 'Address', 'Wallet_Address', 'address', etc.")
-            
-            wallets = []
-            for _, row in df.iterrows():
-                address = str(row[address_col]).strip()
-                name = str(row[name_col]).strip() if name_col and pd.notna(row[name_col]) else f"Wallet_{len(wallets) + 1}"
-                
-                if address and address.lower() != 'nan' and len(address) > 10:  # Basic validation
-                    wallets.append({
-                        'name': name,
-                        'address': address
-                    })
+            wallets = self._df_to_wallets(df)
             
             print(f"✅ Loaded {len(wallets)} wallet addresses from CSV file")
             return wallets
@@ -182,269 +296,655 @@ class STXBalanceChecker:
             print(f"❌ Error loading CSV file: {e}")
             return []
     
-    def get_balance(self, address: str, name: str = None) -> Optional[Dict]:
+    def _read_wallet_csv(self, source) -> 'pd.DataFrame':
         """
-        Get balance information for a single wallet address
+        Read only the name/address columns of CSV data, as plain strings
+        
+        The header is read first to resolve the columns, so pandas never
+        type-sniffs or materializes anything else.
+        
+        Args:
+            source: Path or seekable file-like object with CSV data
+            
+        Returns:
+            DataFrame with the detected name/address columns
+        """
+        pd = _pd()
+        name_col, address_col = self._find_columns(pd.read_csv(source, nrows=0))
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        
+        usecols = [col for col in (name_col, address_col) if col]
+        # keep_default_na/na_values rather than na_filter=False, which the pyarrow
+        # engine ignores; either way literal 'nan'/'NA'/'null' cells stay text
+        return pd.read_csv(source, usecols=usecols, dtype=str, keep_default_na=False, na_values=[],
+                           engine=CSV_ENGINE, **READ_KWARGS)
+    
+    def _find_columns(self, df: 'pd.DataFrame'):
+        """
+        Find the name and address columns of a sheet
+        
+        Returns:
+            Tuple of (name_col, address_col); either is None when not present
+        """
+        columns = set(df.columns)
+        name_col = next((col for col in self.NAME_COLUMNS_PRIORITY if col in columns), None)
+        address_col = next((col for col in self.ADDRESS_COLUMNS_PRIORITY if col in columns), None)
+        return name_col, address_col
+    
+    def _df_to_wallets(self, df: 'pd.DataFrame') -> List[Dict[str, str]]:
+        """
+        Extract wallet names and addresses from a loaded sheet
+        
+        Column detection, stripping and validation run as vectorized pandas
+        operations rather than row by row.
         
         Args:
+            df: DataFrame read from Excel, CSV or Google Sheets
+            
+        Returns:
+            List of dictionaries with 'name' and 'address' keys
+            
+        Raises:
+            ValueError: If no address column is found
+        """
+        pd = _pd()
+        name_col, address_col = self._find_columns(df)
+        if not address_col:
+            raise ValueError("No address column found. Expected columns: 'Address', 'Wallet_Address', 'address', etc.")
+        
+        # Validate the whole address column at once against the c32 address shape
+        addresses = df[address_col].astype('string').str.strip()
+        mask = addresses.notna() & addresses.str.match(STX_ADDRESS_PATTERN, case=False).fillna(False)
+        
+        dropped = int((addresses.fillna('') != '').sum() - mask.sum())
+        if dropped:
+            print(f"⚠️  Skipped {dropped} rows without a valid STX address")
+        
+        df = df[mask]
+        addresses = addresses[mask]
+        
+        # Unnamed wallets are numbered by their position among the valid rows
+        fallback = 'Wallet_' + pd.Series(range(1, len(addresses) + 1), index=addresses.index).astype('string')
+        if name_col:
+            # Blank cells count as missing (CSV is read without NA conversion)
+            names = df[name_col].astype('string').str.strip().replace('', pd.NA).fillna(fallback)
+        else:
+            names = fallback
+        
+        return [{'name': name, 'address': address} for name, address in zip(names, addresses)]
+    
+    def _parse_balance(self, data, address: str, name: str = None) -> Balance:
+        """
+        Turn a raw account API response into a balance result
+        
+        Args:
+            data: Decoded JSON response from the accounts endpoint
             address: Stacks wallet address
             name: Optional wallet name/label
             
         Returns:
-            Dictionary with balance info or None if error
+            Balance result (or error details)
+        """
+        # Check if the response has the expected structure
+        if not isinstance(data, dict):
+            return Balance(name or 'Unknown', address, success=False,
+                           error=f"Invalid API response format: expected dict, got {type(data)}")
+        
+        # Handle different response formats
+        if 'balance' not in data:
+            return Balance(name or 'Unknown', address, success=False,
+                           error="No balance information found in API response")
+        
+        balance_info = data['balance']
+        
+        # Handle case where balance is a string (hex value) instead of dict
+        if isinstance(balance_info, str):
+            # Check if it's a hex value (balance in µSTX)
+            if balance_info.startswith('0x'):
+                try:
+                    # Convert hex to integer (µSTX)
+                    balance_ustx = int(balance_info, 16)
+                    
+                    # No locked info available in this format
+                    return Balance(name or 'Unknown', address, balance_ustx=balance_ustx,
+                                   nonce=data.get('nonce', 0))
+                except ValueError:
+                    return Balance(name or 'Unknown', address, success=False,
+                                   error=f"Invalid hex balance format: {balance_info}")
+            else:
+                return Balance(name or 'Unknown', address, success=False,
+                               error=f"API returned error: {balance_info}")
+        
+        # Check if STX balance information exists
+        if not isinstance(balance_info, dict) or 'stx' not in balance_info:
+            return Balance(name or 'Unknown', address, success=False,
+                           error="No STX balance information found")
+        
+        stx_info = balance_info['stx']
+        
+        # Handle case where stx info is also a string
+        if isinstance(stx_info, str):
+            return Balance(name or 'Unknown', address, success=False,
+                           error=f"STX info error: {stx_info}")
+        
+        # Extract balance information with safe defaults
+        balance_ustx = int(stx_info.get('balance', 0))
+        locked_ustx = int(stx_info.get('locked', 0))
+        
+        return Balance(name or 'Unknown', address, balance_ustx=balance_ustx, locked_ustx=locked_ustx,
+                       nonce=data.get('nonce', 0))
+    
+    def _http_error_message(self, status_code: int, reason: str) -> str:
+        """
+        Map an HTTP error status to a user-facing error message
+        
+        Shared by the requests and aiohttp paths so reports read the same
+        whichever one fetched the balance.
+        
+        Args:
+            status_code: HTTP status of the failed response
+            reason: HTTP reason phrase (e.g. 'Bad Request')
+        """
+        if status_code == 404:
+            return "Wallet address not found or invalid"
+        elif status_code == 429:
+            return "Rate limit exceeded. Try lowering the concurrency"
+        return f"HTTP Error {status_code}: {reason}"
+    
+    def _network_error_message(self, err: Exception) -> str:
+        """
+        Map a requests or aiohttp network failure to a user-facing error message
+        
+        The two libraries word the same failure differently, so timeouts and
+        refused/dropped connections get fixed messages.
+        """
+        if isinstance(err, (requests.exceptions.Timeout, asyncio.TimeoutError)):
+            return "Network Error: Request timed out"
+        if isinstance(err, (requests.exceptions.ConnectionError, aiohttp.ClientConnectionError)):
+            return "Network Error: Could not connect to the API"
+        return f"Network Error: {str(err) or type(err).__name__}"
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retrying a rate-limited or failed request
+        
+        Honors the server's Retry-After header when it gives a number of seconds,
+        otherwise uses capped exponential backoff with jitter.
+        """
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date form, fall back to our own schedule
+        return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * (1 + random.random() * 0.5)
+    
+    def _note_rate_limit(self, status: int, headers):
         """
+        Record the server's rate limit state from a response
+        
+        When the remaining quota runs low every request pauses until the
+        advertised reset, and a 429 with Retry-After pauses everyone, not
+        just the request that hit it. This relies on the session adapter
+        passing every 429 through (no urllib3 status retries), so the first
+        one is seen here rather than only the last after hidden retries.
+        """
+        wait = 0.0
+        remaining = next((headers[h] for h in RATE_LIMIT_REMAINING_HEADERS if h in headers), None)
+        reset = next((headers[h] for h in RATE_LIMIT_RESET_HEADERS if h in headers), None)
         try:
-            url = f"{self.base_url}{address}"
-            response = self.session.get(url, timeout=10)
+            if remaining is not None and reset is not None and int(remaining) <= RATE_LIMIT_THRESHOLD:
+                reset = float(reset)
+                # Reset is either seconds until the window resets or a Unix timestamp
+                wait = reset - time.time() if reset > 1e9 else reset
+            if status == 429 and 'Retry-After' in headers:
+                wait = max(wait, float(headers['Retry-After']))
+        except ValueError:
+            return
+        if wait > 0:
+            self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + wait)
+    
+    def _rate_limit_wait(self) -> float:
+        """Seconds left before requests may be sent again"""
+        return max(0.0, self._rate_limited_until - time.monotonic())
+    
+    def _current_block_height(self) -> Optional[int]:
+        """Get the current chain tip height, or None if it can't be fetched"""
+        try:
+            response = self.session.get(f"{self.api_root}/extended/v1/block", params={'limit': 1}, timeout=10)
             response.raise_for_status()
+            return int(orjson.loads(response.content)['results'][0]['height'])
+        except (requests.exceptions.RequestException, KeyError, IndexError, ValueError, TypeError):
+            return None
+    
+    def _cache_path(self, address: str) -> Path:
+        """Location of the cached API response for an address"""
+        key = hashlib.sha1(address.encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def _cache_enabled(self, block_height: Optional[int]) -> bool:
+        """Whether a cache entry can be used for this chain tip"""
+        return self.use_cache and (block_height is not None or self.cache_ttl > 0)
+    
+    def _cache_load(self, address: str, block_height: Optional[int]):
+        """Return the cached API response for an address, or None on a cache miss"""
+        if not self._cache_enabled(block_height):
+            return None
+        path = self._cache_path(address)
+        try:
+            # Without a chain tip, any entry younger than the TTL will do
+            if block_height is None and time.time() - path.stat().st_mtime > self.cache_ttl:
+                return None
+            with open(path, 'rb') as f:
+                entry = orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        # An entry recorded at another chain tip is a miss
+        if block_height is not None and entry.get('block_height') != block_height:
+            return None
+        data = entry.get('response')
+        # Entries written without a nonce would report nonce 0; refetch them
+        return data if isinstance(data, dict) and 'nonce' in data else None
+    
+    def _cache_store(self, address: str, block_height: Optional[int], data):
+        """
+        Atomically write an API response to the cache (failures are ignored)
+        
+        Each address has a single entry that records the chain tip it was
+        fetched at, so writing at a new tip replaces the old entry instead of
+        leaving it behind.
+        """
+        if not self._cache_enabled(block_height):
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps({'block_height': block_height, 'response': data}))
+            os.replace(tmp_path, self._cache_path(address))
+        except OSError:
+            pass
+    
+    def get_balance(self, address: str, name: str = None, block_height: Optional[int] = None) -> Balance:
+        """
+        Get balance information for a single wallet address
+        
+        Args:
+            address: Stacks wallet address
+            name: Optional wallet name/label
+            block_height: Current chain tip used to key the response cache
+                (without it, cached responses expire after cache_ttl)
+            
+        Returns:
+            Balance result (with error details if the lookup failed)
+        """
+        cached = self._cache_load(address, block_height)
+        if cached is not None:
+            return self._parse_balance(cached, address, name)
+        
+        debug_body = ''
+        try:
+            url = self.base_url + address
+            # Stream so the body is only read when we actually need it, and
+            # release each connection back to the pool as soon as we're done
+            for attempt in range(MAX_RETRIES):
+                time.sleep(self._rate_limit_wait())
+                response = self.session.get(url, timeout=10, stream=True)
+                self._note_rate_limit(response.status_code, response.headers)
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES - 1:
+                    break
+                response.close()
+                time.sleep(self._backoff_delay(attempt, response.headers.get('Retry-After')))
             
-            data = response.json()
+            with response:
+                if response.status_code >= 400:
+                    # Only the start of an error body is kept for debug output
+                    debug_body = next(response.iter_content(200), b'').decode(errors='replace')
+                response.raise_for_status()
+                data = orjson.loads(response.content)
             
             # Debug: Print the response structure for troubleshooting
             # Uncomment the next line if you need to debug API responses
-            # print(f"DEBUG - API Response for {address}: {json.dumps(data, indent=2)}")
+            # print(f"DEBUG - API Response for {address}: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}")
             
-            # Check if the response has the expected structure
-            if not isinstance(data, dict):
-                return {
-                    'name': name or 'Unknown',
-                    'address': address,
-                    'error': f"Invalid API response format: expected dict, got {type(data)}",
-                    'success': False
-                }
-            
-            # Handle different response formats
-            if 'balance' not in data:
-                return {
-                    'name': name or 'Unknown',
-                    'address': address,
-                    'error': "No balance information found in API response",
-                    'success': False
-                }
-            
-            balance_info = data['balance']
-            
-            # Handle case where balance is a string (hex value) instead of dict
-            if isinstance(balance_info, str):
-                # Check if it's a hex value (balance in µSTX)
-                if balance_info.startswith('0x'):
-                    try:
-                        # Convert hex to integer (µSTX)
-                        balance_ustx = int(balance_info, 16)
-                        balance_stx = balance_ustx / 1_000_000
-                        
-                        return {
-                            'name': name or 'Unknown',
-                            'address': address,
-                            'balance_stx': balance_stx,
-                            'locked_stx': 0.0,  # No locked info available in this format
-                            'total_stx': balance_stx,
-                            'balance_ustx': balance_ustx,
-                            'locked_ustx': 0,
-                            'nonce': data.get('nonce', 0),
-                            'success': True
-                        }
-                    except ValueError:
-                        return {
-                            'name': name or 'Unknown',
-                            'address': address,
-                            'error': f"Invalid hex balance format: {balance_info}",
-                            'success': False
-                        }
-                else:
-                    return {
-                        'name': name or 'Unknown',
-                        'address': address,
-                        'error': f"API returned error: {balance_info}",
-                        'success': False
-                    }
-            
-            # Check if STX balance information exists
-            if not isinstance(balance_info, dict) or 'stx' not in balance_info:
-                return {
-                    'name': name or 'Unknown',
-                    'address': address,
-                    'error': "No STX balance information found",
-                    'success': False
-                }
-            
-            stx_info = balance_info['stx']
-            
-            # Handle case where stx info is also a string
-            if isinstance(stx_info, str):
-                return {
-                    'name': name or 'Unknown',
-                    'address': address,
-                    'error': f"STX info error: {stx_info}",
-                    'success': False
-                }
-            
-            # Extract balance information with safe defaults
-            balance_ustx = int(stx_info.get('balance', 0))
-            locked_ustx = int(stx_info.get('locked', 0))
-            
-            balance_stx = balance_ustx / 1_000_000
-            locked_stx = locked_ustx / 1_000_000
-            
-            return {
-                'name': name or 'Unknown',
-                'address': address,
-                'balance_stx': balance_stx,
-                'locked_stx': locked_stx,
-                'total_stx': balance_stx + locked_stx,
-                'balance_ustx': balance_ustx,
-                'locked_ustx': locked_ustx,
-                'nonce': data.get('nonce', 0),
-                'success': True
-            }
-            
-        except requests.exceptions.HTTPError as err:
-            # Handle specific HTTP errors
-            if response.status_code == 404:
-                error_msg = "Wallet address not found or invalid"
-            elif response.status_code == 429:
-                error_msg = "Rate limit exceeded. Try increasing delay between requests"
-            else:
-                error_msg = f"HTTP Error {response.status_code}: {err}"
-                
-            return {
-                'name': name or 'Unknown',
-                'address': address,
-                'error': error_msg,
-                'success': False
-            }
+            result = self._parse_balance(data, address, name)
+            if result.success:
+                self._cache_store(address, block_height, data)
+            return result
+            
+        except requests.exceptions.HTTPError:
+            # Keep the failing response details for check_wallets_from_list's debug output
+            return Balance(name or 'Unknown', address, success=False,
+                           error=self._http_error_message(response.status_code, response.reason),
+                           debug_status=response.status_code, debug_body=debug_body)
         except requests.exceptions.RequestException as err:
-            return {
-                'name': name or 'Unknown',
-                'address': address,
-                'error': f"Network Error: {err}",
-                'success': False
-            }
+            return Balance(name or 'Unknown', address, success=False,
+                           error=self._network_error_message(err))
         except (KeyError, ValueError, TypeError) as err:
-            return {
-                'name': name or 'Unknown',
-                'address': address,
-                'error': f"Data parsing error: {err}",
-                'success': False
-            }
+            return Balance(name or 'Unknown', address, success=False,
+                           error=f"Data parsing error: {err}")
+    
+    def _batch_available(self) -> bool:
+        """Whether the batch endpoint is worth trying (it hasn't recently 404'd)"""
+        if not self._batch_unavailable and self.use_cache:
+            try:
+                age = time.time() - self._batch_marker.stat().st_mtime
+                self._batch_unavailable = age < BATCH_UNAVAILABLE_TTL
+            except OSError:
+                pass
+        return not self._batch_unavailable
+    
+    def _mark_batch_unavailable(self):
+        """Remember that the batch endpoint doesn't exist on this API"""
+        self._batch_unavailable = True
+        if self.use_cache:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._batch_marker.touch()
+            except OSError:
+                pass
     
-    def check_wallets_from_list(self, wallets: List[Dict[str, str]], delay: float = 0.1, debug_mode: bool = False) -> List[Dict]:
+    def get_balances_batch(self, addresses: List[str], block_height: Optional[int] = None,
+                           batch_size: int = BATCH_SIZE) -> Dict[str, Balance]:
+        """
+        Get balances for many addresses using the batch balances endpoint
+        
+        Addresses are sent in chunks of batch_size, so N addresses cost
+        ceil(N / batch_size) requests instead of N.
+        
+        Args:
+            addresses: Stacks wallet addresses
+            block_height: Current chain tip used to key the response cache
+            batch_size: Maximum number of addresses per request
+            
+        Entries without a nonce are treated as unanswered, so those wallets
+        fall back to the accounts endpoint rather than reporting nonce 0.
+        
+        Returns:
+            Dictionary mapping address to Balance for every address the
+            batch endpoint answered successfully (others are simply missing)
+        """
+        if not self._batch_available():
+            return {}
+        
+        url = f"{self.api_root}/extended/v2/addresses/balances"
+        results = {}
+        
+        remaining = iter(addresses)
+        while True:
+            chunk = list(islice(remaining, batch_size))
+            if not chunk:
+                break
+            
+            try:
+                time.sleep(self._rate_limit_wait())
+                response = self.session.get(url, params=[('address', a) for a in chunk], timeout=10)
+                self._note_rate_limit(response.status_code, response.headers)
+                if response.status_code == 404:
+                    self._mark_batch_unavailable()
+                    break
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except (requests.exceptions.RequestException, ValueError):
+                # Endpoint unavailable or rate limited - let callers fall back
+                # to per-address lookups for everything not fetched yet
+                break
+            
+            # Index the reply by address once; it is either {address: balances}
+            # or a list of balance entries that carry their own address
+            if isinstance(data, dict) and isinstance(data.get('results'), list):
+                data = data['results']
+            if isinstance(data, list):
+                data = {entry.get('address'): entry for entry in data if isinstance(entry, dict)}
+            if not isinstance(data, dict):
+                break
+            
+            for address in chunk:
+                entry = data.get(address)
+                if not isinstance(entry, dict) or 'nonce' not in entry:
+                    continue
+                account = {'balance': entry, 'nonce': entry['nonce']}
+                result = self._parse_balance(account, address)
+                if result.success:
+                    results[address] = result
+                    self._cache_store(address, block_height, account)
+        
+        return results
+    
+    async def get_balance_async(self, session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                                 address: str, name: str = None, block_height: Optional[int] = None) -> Balance:
+        """
+        Async counterpart of get_balance, sharing one aiohttp session
+        
+        Args:
+            session: Shared aiohttp client session
+            sem: Semaphore bounding the number of in-flight requests
+            address: Stacks wallet address
+            name: Optional wallet name/label
+            block_height: Current chain tip used to key the response cache
+            
+        Returns:
+            Balance result (with error details if the lookup failed)
+        """
+        url = self.base_url + address
+        debug_body = ''
+        try:
+            for attempt in range(MAX_RETRIES):
+                async with sem:
+                    await asyncio.sleep(self._rate_limit_wait())
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                        self._note_rate_limit(response.status, response.headers)
+                        if response.status in RETRY_STATUSES and attempt < MAX_RETRIES - 1:
+                            delay = self._backoff_delay(attempt, response.headers.get('Retry-After'))
+                        else:
+                            if response.status >= 400:
+                                debug_body = (await response.content.read(200)).decode(errors='replace')
+                            response.raise_for_status()
+                            data = orjson.loads(await response.read())
+                            break
+                # Back off outside the semaphore so other wallets keep moving
+                await asyncio.sleep(delay)
+            
+            result = self._parse_balance(data, address, name)
+            if result.success:
+                self._cache_store(address, block_height, data)
+            return result
+            
+        except aiohttp.ClientResponseError as err:
+            return Balance(name or 'Unknown', address, success=False,
+                           error=self._http_error_message(err.status, err.message),
+                           debug_status=err.status, debug_body=debug_body)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            return Balance(name or 'Unknown', address, success=False,
+                           error=self._network_error_message(err))
+        except (KeyError, ValueError, TypeError) as err:
+            return Balance(name or 'Unknown', address, success=False,
+                           error=f"Data parsing error: {err}")
+    
+    async def check_wallets_async(self, wallets: List[Dict[str, str]], concurrency: int = 32,
+                                  block_height: Optional[int] = None) -> List[Balance]:
+        """
+        Fetch balances for all wallets concurrently
+        
+        Args:
+            wallets: List of wallet dictionaries with 'name' and 'address'
+            concurrency: Maximum number of requests in flight at once
+            block_height: Current chain tip used to key the response cache
+            
+        Returns:
+            List of Balance results, in the same order as wallets
+        """
+        sem = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=concurrency, keepalive_timeout=30)
+        
+        async with aiohttp.ClientSession(connector=connector, headers={'User-Agent': self.session.headers['User-Agent']}) as session:
+            return await tqdm.gather(*[
+                self.get_balance_async(session, sem, wallet['address'], wallet['name'], block_height)
+                for wallet in wallets
+            ], unit='wallet')
+    
+    def check_wallets_threaded(self, wallets: List[Dict[str, str]], max_workers: int = 32,
+                               block_height: Optional[int] = None) -> List[Balance]:
+        """
+        Fetch balances for all wallets on a thread pool
+        
+        Alternative to check_wallets_async for callers that can't run an event
+        loop; requests releases the GIL while waiting on the socket and the
+        shared session's pool is sized for parallel use.
+        
+        Args:
+            wallets: List of wallet dictionaries with 'name' and 'address'
+            max_workers: Number of worker threads (requests in flight at once)
+            block_height: Current chain tip used to key the response cache
+            
+        Returns:
+            List of Balance results, in the same order as wallets
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.get_balance, wallet['address'], wallet['name'], block_height)
+                for wallet in wallets
+            ]
+            for _ in tqdm(as_completed(futures), total=len(futures), unit='wallet'):
+                pass
+            
+            return [future.result() for future in futures]
+    
+    def check_wallets_from_list(self, wallets: List[Dict[str, str]], concurrency: int = 32, debug_mode: bool = False,
+                                use_threads: bool = False) -> List[Balance]:
         """
         Check balances for wallets from loaded list
         
         Args:
             wallets: List of wallet dictionaries with 'name' and 'address'
-            delay: Delay between requests in seconds
+            concurrency: Maximum number of concurrent API requests
             debug_mode: Enable debug output for failed requests
+            use_threads: Fetch on a thread pool instead of an asyncio event loop
             
         Returns:
-            List of balance dictionaries
+            List of Balance results
         """
-        results = []
+        # Each address is looked up once, however many rows share it
+        unique = {}
+        for wallet in wallets:
+            unique.setdefault(wallet['address'], wallet['name'])
         
-        print(f"🔍 Checking balances for {len(wallets)} wallets...")
+        print(f"🔍 Checking balances for {len(wallets)} wallets ({len(unique)} unique) - "
+              f"fetching {len(unique)}, up to {concurrency} at a time...")
         if debug_mode:
             print("🐛 Debug mode enabled - will show detailed errors")
         
-        for i, wallet in enumerate(wallets):
-            print(f"   Checking {i+1}/{len(wallets)}: {wallet['name']}")
-            result = self.get_balance(wallet['address'], wallet['name'])
-            
-            # Debug output for failed requests
-            if debug_mode and not result['success']:
-                print(f"     ⚠️  Failed: {result['error']}")
-                print(f"     📍 Address: {result['address']}")
+        # Serve wallets unchanged since the last run at this chain tip (or
+        # within the TTL when the tip is unavailable) from disk; the tip is
+        # fetched once per run and passed down, so a long-lived checker never
+        # pins an old block
+        block_height = self._current_block_height() if self.use_cache else None
+        known = {}
+        for address in unique:
+            cached = self._cache_load(address, block_height)
+            if cached is not None:
+                known[address] = self._parse_balance(cached, address)
+        if known:
+            source = f"block {block_height}" if block_height is not None else f"last {self.cache_ttl:g}s"
+            print(f"💾 {len(known)}/{len(unique)} balances served from cache ({source})")
+        
+        pending = [address for address in unique if address not in known]
+        batched = self.get_balances_batch(pending, block_height) if pending else {}
+        if batched:
+            print(f"📦 Batch endpoint returned {len(batched)}/{len(pending)} balances")
+        known.update(batched)
+        
+        # Fall back to per-address lookups for anything the batch call missed
+        missing = [{'name': unique[address], 'address': address} for address in pending if address not in known]
+        if missing:
+            if use_threads:
+                fetched = self.check_wallets_threaded(missing, concurrency, block_height)
+            else:
+                fetched = asyncio.run(self.check_wallets_async(missing, concurrency, block_height))
+            known.update(zip((wallet['address'] for wallet in missing), fetched))
+        
+        # Debug output for failed requests
+        if debug_mode:
+            for wallet in wallets:
+                result = known[wallet['address']]
+                if result.success:
+                    continue
                 
-                # Try to get raw API response for debugging
-                try:
-                    url = f"{self.base_url}{wallet['address']}"
-                    response = self.session.get(url, timeout=5)
-                    print(f"     📡 Status: {response.status_code}")
-                    if response.status_code != 200:
-                        print(f"     📄 Response: {response.text[:200]}...")
-                except Exception as debug_error:
-                    print(f"     🔧 Debug error: {debug_error}")
-            
-            results.append(result)
-            
-            # Add delay between requests (except for the last one)
-            if i < len(wallets) - 1 and delay > 0:
-                time.sleep(delay)
+                print(f"     ⚠️  Failed: {wallet['name']}: {result.error}")
+                print(f"     📍 Address: {result.address}")
+                
+                # Raw API response captured by the original request, if any
+                if result.debug_status is not None:
+                    print(f"     📡 Status: {result.debug_status}")
+                    print(f"     📄 Response: {result.debug_body}...")
         
-        return results
+        # Fan the per-address results back out to every row, keeping each row's
+        # name; debug details are only for the output above, not for reports/exports
+        return [replace(known[wallet['address']], name=wallet['name'] or 'Unknown', debug_status=None, debug_body='')
+                for wallet in wallets]
     
-    def print_results(self, results: List[Dict]):
+    def print_results(self, results: List[Balance]):
         """Print formatted results"""
-        print("\n" + "=" * 100)
-        print("STX WALLET BALANCE REPORT")
-        print("=" * 100)
+        # Aggregate once up front so the loop below only formats; the total is
+        # summed in integer µSTX and converted to STX a single time
+        successful = [result for result in results if result.success]
+        successful_checks = len(successful)
+        total_balance = sum(result.balance_ustx + result.locked_ustx for result in successful) * _MICRO
         
-        total_balance = 0
-        successful_checks = 0
+        # Build the whole report first and write it to stdout in one go
+        lines = ["", "=" * 100, "STX WALLET BALANCE REPORT", "=" * 100]
         
         for result in results:
-            if result['success']:
-                print(f"\n✅ {result['name']}")
-                print(f"   Address:           {result['address']}")
-                print(f"   Available Balance: {result['balance_stx']:>12.6f} STX")
-                if result['locked_stx'] > 0:
-                    print(f"   Locked Balance:    {result['locked_stx']:>12.6f} STX")
-                    print(f"   Total Balance:     {result['total_stx']:>12.6f} STX")
-                else:
-                    print(f"   Locked Balance:    {0:>12.6f} STX")
-                print(f"   Nonce:             {result['nonce']:>12}")
-                
-                total_balance += result['total_stx']
-                successful_checks += 1
+            if result.success:
+                lines.extend((
+                    f"\n✅ {result.name}",
+                    f"   Address:           {result.address}",
+                    f"   Available Balance: {result.balance_stx:>12.6f} STX",
+                    f"   Locked Balance:    {result.locked_stx:>12.6f} STX",
+                ))
+                if result.locked_stx > 0:
+                    lines.append(f"   Total Balance:     {result.total_stx:>12.6f} STX")
+                lines.append(f"   Nonce:             {result.nonce:>12}")
             else:
-                print(f"\n❌ {result['name']}")
-                print(f"   Address: {result['address']}")
-                print(f"   Error: {result['error']}")
-        
-        print("\n" + "=" * 100)
-        print("SUMMARY")
-        print("=" * 100)
-        print(f"Total wallets checked: {len(results)}")
-        print(f"Successful checks:     {successful_checks}")
-        print(f"Failed checks:         {len(results) - successful_checks}")
+                lines.extend((
+                    f"\n❌ {result.name}",
+                    f"   Address: {result.address}",
+                    f"   Error: {result.error}",
+                ))
+        
+        lines.append("\n" + "=" * 100)
+        lines.append("SUMMARY")
+        lines.append("=" * 100)
+        lines.append(f"Total wallets checked: {len(results)}")
+        lines.append(f"Successful checks:     {successful_checks}")
+        lines.append(f"Failed checks:         {len(results) - successful_checks}")
         if successful_checks > 0:
-            print(f"Combined balance:      {total_balance:>12.6f} STX")
-        print("=" * 100)
+            lines.append(f"Combined balance:      {total_balance:>12.6f} STX")
+        lines.append("=" * 100)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def export_results(self, results: List[Dict], filename: str = 'stx_balance_report'):
+    def export_results(self, results: List[Balance], filename: str = 'stx_balance_report'):
         """Export results to both JSON and Excel"""
         # JSON export
         json_file = f"{filename}.json"
-        with open(json_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps([result.to_dict() for result in results], default=_json_default, option=orjson.OPT_INDENT_2))
         
-        # Excel export
+        # Excel export, built column-wise from the result fields (failed
+        # checks already carry zero amounts)
+        pd = _pd()
         excel_file = f"{filename}.xlsx"
-        df_data = []
-        for result in results:
-            if result['success']:
-                df_data.append({
-                    'Name': result['name'],
-                    'Address': result['address'],
-                    'Available_STX': result['balance_stx'],
-                    'Locked_STX': result['locked_stx'],
-                    'Total_STX': result['total_stx'],
-                    'Nonce': result['nonce'],
-                    'Status': 'Success'
-                })
-            else:
-                df_data.append({
-                    'Name': result['name'],
-                    'Address': result['address'],
-                    'Available_STX': 0,
-                    'Locked_STX': 0,
-                    'Total_STX': 0,
-                    'Nonce': 0,
-                    'Status': f"Error: {result['error']}"
-                })
-        
-        df = pd.DataFrame(df_data)
-        df.to_excel(excel_file, index=False)
+        df = pd.DataFrame({header: [getattr(result, attr) for result in results]
+                           for attr, header in EXPORT_COLUMNS.items()})
+        stx_columns = [EXPORT_COLUMNS[attr] for attr in ('balance_stx', 'locked_stx', 'total_stx')]
+        df[stx_columns] = df[stx_columns].astype(float)
+        df['Status'] = ['Success' if result.success else f"Error: {result.error}" for result in results]
+        
+        with pd.ExcelWriter(excel_file, engine=EXCEL_WRITER_ENGINE) as writer:
+            df.to_excel(writer, index=False)
         
         print(f"\n📁 Results exported to:")
         print(f"   - {json_file}")
@@ -452,7 +952,14 @@ class STXBalanceChecker:
 
 def main():
     """Main function with interactive menu"""
-    checker = STXBalanceChecker()
+    parser = argparse.ArgumentParser(description="Check STX wallet balances")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Ignore cached API responses and always query the API")
+    parser.add_argument('--ttl', type=float, default=300,
+                        help="Seconds a cached response stays valid when the chain tip is unavailable (default: 300)")
+    args = parser.parse_args()
+    
+    checker = STXBalanceChecker(use_cache=not args.no_cache, cache_ttl=args.ttl)
     
     print("=" * 60)
     print("STX WALLET BALANCE CHECKER")
@@ -470,9 +977,9 @@ def main():
     
     if choice == '1':
         file_path = input("Enter Excel file path: ").strip()
-        sheet_name = input("Enter sheet name (press Enter for first sheet): ").strip()
-        sheet_name = sheet_name if sheet_name else None
-        wallets = checker.load_wallets_from_excel(file_path, sheet_name)
+        sheet_input = input("Enter sheet name(s), comma separated (press Enter for first sheet): ").strip()
+        sheet_names = [sheet.strip() for sheet in sheet_input.split(',') if sheet.strip()]
+        wallets = checker.load_wallets_from_excel(file_path, sheet_names or None)
         
     elif choice == '2':
         sheet_url = input("Enter Google Sheets URL: ").strip()
@@ -500,21 +1007,21 @@ def main():
         print(f"\n🔍 Debug mode: Testing address {test_address}")
         
         try:
-            url = f"{checker.base_url}{test_address}"
+            url = checker.base_url + test_address
             print(f"📡 API URL: {url}")
             
             response = checker.session.get(url, timeout=10)
             print(f"📊 Response Status: {response.status_code}")
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 print(f"📋 Full API Response:")
-                print(json.dumps(data, indent=2))
+                print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
                 
                 # Test our parsing logic
                 result = checker.get_balance(test_address, "Debug Test")
                 print(f"\n✅ Parsed Result:")
-                print(json.dumps(result, indent=2))
+                print(orjson.dumps(result.to_dict(), default=_json_default, option=orjson.OPT_INDENT_2).decode())
             else:
                 print(f"❌ Error: {response.status_code} - {response.text}")
                 
@@ -536,7 +1043,7 @@ def main():
     debug_mode = debug_choice in ['y', 'yes']
     
     # Check balances
-    results = checker.check_wallets_from_list(wallets, delay=0.1, debug_mode=debug_mode)
+    results = checker.check_wallets_from_list(wallets, concurrency=32, debug_mode=debug_mode)
     
     # Display results
     checker.print_results(results)